@@ -2,25 +2,54 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
 import logging
 import os
+import re
 import shutil
+import stat
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPException
 from pathlib import Path
-from typing import Iterable, Optional
-from urllib.error import URLError
-from urllib.request import urlopen
+from typing import Iterable, Mapping, Optional
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+try:
+    import requests
+    from urllib3.exceptions import HTTPError as Urllib3HTTPError
+except ImportError:
+    requests = None
 
 DEFAULT_MIRROR = "https://mirror.ctan.org/systems/texlive/tlnet"
 DEFAULT_ARCHIVE_MIRROR = "ftp://tug.org/historic/systems/texlive"
 DEFAULT_ARCHIVE_NAME = "install-tl-unx.tar.gz"
 DEFAULT_CACHE_BUSTER = "0"
+DEFAULT_DOWNLOAD_CHUNK_SIZE = 1 << 20
+DOWNLOAD_TIMEOUT = 30
+DOWNLOAD_WORKERS = min(8, (os.cpu_count() or 1) * 2)
+DEFAULT_PATH = "/usr/local/bin:/usr/bin:/bin"
 SYMLINK_DESTINATION = Path("/usr/local/bin")
+SYMLINK_WORKERS = min(32, (os.cpu_count() or 4) * 4)
 KNOWN_TEXLIVE_ROOTS = (
     Path("/usr/local/texlive"),
     Path("/opt/texlive"),
 )
+CONTENT_RANGE_PATTERN = re.compile(r"bytes 0-0/(\d+)")
+TEXMFROOT_PATTERN = re.compile(r"^[ \t]*TEXMFROOT[ \t]+(.+?)[ \t]*$", re.MULTILINE)
+
+
+def positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}") from None
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value!r}")
+    return number
 
 
 def configure_logging(verbose: bool) -> None:
@@ -34,31 +63,205 @@ def append_cache_buster(url: str, token: str) -> str:
     return f"{url}{'&' if '?' in url else '?'}ts={token}"
 
 
-def download_installer(version: str, archive_name: str, mirror: str, archive_mirror: str, cache_buster: str, output: Optional[Path]) -> None:
-    output_path = output or Path(archive_name)
+def build_repository_url(version: str, mirror: str, archive_mirror: str) -> str:
     if version == "latest":
-        base = mirror.rstrip("/")
-        url = f"{base}/{archive_name}"
-    else:
-        base = archive_mirror.rstrip("/")
-        url = f"{base}/{version}/tlnet-final/{archive_name}"
+        return mirror.rstrip("/")
+    return f"{archive_mirror.rstrip('/')}/{version}/tlnet-final"
+
+
+def build_installer_url(version: str, archive_name: str, mirror: str, archive_mirror: str, cache_buster: str = DEFAULT_CACHE_BUSTER) -> str:
+    url = f"{build_repository_url(version, mirror, archive_mirror)}/{archive_name}"
+    return append_cache_buster(url, cache_buster)
 
-    url = append_cache_buster(url, cache_buster)
-    logging.info("Downloading installer: %s", url)
 
+def probe_range_support(url: str) -> tuple[str, Optional[int]]:
+    # A one-byte ranged GET survives redirects, whereas urllib downgrades a redirected HEAD to a full GET.
     try:
-        with urlopen(url) as response, output_path.open("wb") as target:
-            shutil.copyfileobj(response, target)
-    except URLError as exc:
-        logging.error("Failed to download installer from %s: %s", url, exc)
-        raise SystemExit(1) from exc
+        with urlopen(Request(url, headers={"Range": "bytes=0-0"}), timeout=DOWNLOAD_TIMEOUT) as response:
+            final_url = response.geturl()
+            status = response.status
+            content_range = response.headers.get("Content-Range", "")
+    except (URLError, HTTPException, OSError) as exc:
+        logging.debug("Range probe for %s failed: %s", url, exc)
+        return url, None
+
+    match = CONTENT_RANGE_PATTERN.fullmatch(content_range.strip())
+    if status != 206 or not match:
+        return final_url, None
+    return final_url, int(match.group(1))
+
+
+def fetch_range(url: str, fd: int, start: int, end: int, chunk_size: int) -> None:
+    request = Request(url, headers={"Range": f"bytes={start}-{end}"})
+    offset = start
+    with urlopen(request, timeout=DOWNLOAD_TIMEOUT) as response:
+        if response.status != 206:
+            raise URLError(f"range request not honoured (HTTP {response.status})")
+        while chunk := response.read(chunk_size):
+            view = memoryview(chunk)
+            while view:
+                written = os.pwrite(fd, view, offset)
+                view = view[written:]
+                offset += written
+    if offset != end + 1:
+        raise URLError(f"short read for bytes {start}-{end}")
+
+
+def preallocate(fd: int, offset: int, length: int) -> None:
+    try:
+        os.posix_fallocate(fd, offset, length)
+    except OSError as exc:
+        logging.debug("Skipping preallocation: %s", exc)
 
-    logging.info("Downloaded installer to %s", output_path)
+
+def download_parallel(url: str, output_path: Path, length: int, chunk_size: int) -> bool:
+    workers = min(DOWNLOAD_WORKERS, length // chunk_size)
+    if workers < 2:
+        return False
+
+    part_size = -(-length // workers)
+    ranges = [(start, min(start + part_size, length) - 1) for start in range(0, length, part_size)]
+    logging.debug("Downloading %d bytes in %d ranges", length, len(ranges))
+
+    # Ranges land out of order, so never leave this file where a resume could pick it up.
+    # That also makes it the only download target safe to preallocate: a killed run cannot
+    # leave a reserved zero tail that a resume would mistake for received bytes.
+    scratch = output_path.with_name(output_path.name + ".ranges")
+    fd = os.open(scratch, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        preallocate(fd, 0, length)
+        with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+            futures = [executor.submit(fetch_range, url, fd, start, end, chunk_size) for start, end in ranges]
+            for future in futures:
+                future.result()
+    except (URLError, HTTPException, OSError) as exc:
+        logging.warning("Parallel download failed (%s); retrying over a single connection", exc)
+        scratch.unlink(missing_ok=True)
+        return False
+    finally:
+        os.close(fd)
+    os.replace(scratch, output_path)
+    return True
+
+
+def partial_paths(output_path: Path) -> tuple[Path, Path]:
+    partial = output_path.with_name(output_path.name + ".part")
+    return partial, partial.with_name(partial.name + ".validator")
 
 
-def run_subprocess(args: Iterable[str], *, cwd: Optional[Path] = None, check: bool = True, env: Optional[dict[str, str]] = None, suppress_output: bool = False) -> subprocess.CompletedProcess:
-    stdout = subprocess.PIPE if suppress_output else None
-    stderr = subprocess.PIPE if suppress_output else None
+def record_validator(validator_path: Path, headers: Mapping[str, str]) -> None:
+    # If-Range only accepts a strong ETag or the server's own Last-Modified, stored verbatim.
+    etag = headers.get("ETag", "")
+    validator = etag if etag and not etag.startswith("W/") else headers.get("Last-Modified", "")
+    if validator:
+        validator_path.write_text(validator)
+    else:
+        validator_path.unlink(missing_ok=True)
+
+
+def download_serial(url: str, output_path: Path, chunk_size: int) -> None:
+    partial, validator_path = partial_paths(output_path)
+    validator = validator_path.read_text().strip() if validator_path.exists() else ""
+    offset = partial.stat().st_size if partial.exists() and validator else 0
+    headers = {}
+    if offset:
+        logging.info("Resuming partial download at byte %d", offset)
+        headers = {"Range": f"bytes={offset}-", "If-Range": validator}
+    elif partial.exists():
+        logging.info("Discarding partial download without a server validator")
+
+    if requests is not None and url.startswith(("http://", "https://")):
+        try:
+            # Ask for and keep the bytes as served so the file matches the urllib path, Content-Length and any checksum.
+            request_headers = {**headers, "Accept-Encoding": "identity"}
+            with requests.get(url, headers=request_headers, stream=True, allow_redirects=True, timeout=DOWNLOAD_TIMEOUT) as response:
+                if offset and response.status_code == 416:
+                    partial.unlink()
+                    download_serial(url, output_path, chunk_size)
+                    return
+                response.raise_for_status()
+                start = offset if response.status_code == 206 else 0
+                length = response.headers.get("Content-Length", "")
+                expected_size = start + int(length) if length.isdigit() else None
+                with partial.open("ab" if start else "wb") as target:
+                    if not start:
+                        record_validator(validator_path, response.headers)
+                    while chunk := response.raw.read(chunk_size, decode_content=False):
+                        target.write(chunk)
+        except (requests.RequestException, Urllib3HTTPError, OSError) as exc:
+            logging.error("Failed to download installer from %s: %s", url, exc)
+            raise SystemExit(1) from exc
+    else:
+        try:
+            with urlopen(Request(url, headers=headers)) as response:
+                start = offset if response.status == 206 else 0
+                length = response.headers.get("Content-Length", "")
+                expected_size = start + int(length) if length.isdigit() else None
+                with partial.open("ab" if start else "wb") as target:
+                    if not start:
+                        record_validator(validator_path, response.headers)
+                    shutil.copyfileobj(response, target, length=chunk_size)
+        except (URLError, HTTPException, OSError) as exc:
+            if offset and isinstance(exc, HTTPError) and exc.code == 416:
+                partial.unlink()
+                download_serial(url, output_path, chunk_size)
+                return
+            logging.error("Failed to download installer from %s: %s", url, exc)
+            raise SystemExit(1) from exc
+
+    # Servers closing early look like EOF to urllib, so confirm the size before publishing the file.
+    received = partial.stat().st_size
+    if expected_size is not None and received != expected_size:
+        logging.error("Download from %s ended early (%d of %d bytes); keeping %s to resume", url, received, expected_size, partial)
+        raise SystemExit(1)
+    os.replace(partial, output_path)
+    validator_path.unlink(missing_ok=True)
+
+
+def verify_sha256(path: Path, expected: str) -> None:
+    with path.open("rb") as source:
+        actual = hashlib.file_digest(source, "sha256").hexdigest()
+    if actual != expected.strip().lower():
+        logging.error("Checksum mismatch for %s: expected %s, got %s", path, expected, actual)
+        path.unlink()
+        raise SystemExit(1)
+    logging.info("Verified SHA256 checksum of %s", path)
+
+
+def download_installer(version: str, archive_name: str, mirror: str, archive_mirror: str, cache_buster: str, output: Optional[Path], chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE, sha256: str = "") -> None:
+    if chunk_size <= 0:
+        logging.error("Download chunk size must be positive, got %d", chunk_size)
+        raise SystemExit(1)
+    output_path = output or Path(archive_name)
+    url = build_installer_url(version, archive_name, mirror, archive_mirror, cache_buster)
+    logging.info("Downloading installer: %s", url)
+
+    downloaded = False
+    resumable = all(path.exists() for path in partial_paths(output_path))
+    if url.startswith(("http://", "https://")) and not resumable:
+        # Pin the redirect target so every range is served by the same mirror.
+        range_url, length = probe_range_support(url)
+        if length:
+            downloaded = download_parallel(range_url, output_path, length, chunk_size)
+        if downloaded:
+            for path in partial_paths(output_path):
+                path.unlink(missing_ok=True)
+    if not downloaded:
+        download_serial(url, output_path, chunk_size)
+
+    logging.info("Downloaded installer to %s", output_path)
+    if sha256:
+        verify_sha256(output_path, sha256)
+
+
+def run_subprocess(args: Iterable[str], *, cwd: Optional[Path] = None, check: bool = True, env: Optional[dict[str, str]] = None, suppress_output: bool = False, capture_stdout: bool = False) -> subprocess.CompletedProcess:
+    stdout = None
+    stderr = None
+    if suppress_output:
+        # Only pay for pipes when the output is consumed or will be logged.
+        debug = logging.getLogger().isEnabledFor(logging.DEBUG)
+        stdout = subprocess.PIPE if capture_stdout or debug else subprocess.DEVNULL
+        stderr = subprocess.PIPE if debug else subprocess.DEVNULL
     try:
         result = subprocess.run(
             list(args),
@@ -88,71 +291,103 @@ def run_subprocess(args: Iterable[str], *, cwd: Optional[Path] = None, check: bo
 
 def locate_install_tl(workdir: Path) -> Path:
     candidate = workdir / "install-tl"
-    if candidate.is_file():
+    try:
+        mode = os.stat(candidate).st_mode
+    except OSError:
+        mode = 0
+    if stat.S_ISREG(mode):
         return candidate
-    nested = workdir / "install-tl" / "install-tl"
-    if nested.is_file():
+    nested = candidate / "install-tl"
+    if stat.S_ISDIR(mode) and nested.is_file():
         return nested
     logging.error("install-tl script not found in %s", workdir)
     raise SystemExit(1)
 
 
-def check_path() -> bool:
-    try:
-        run_subprocess(["tex", "--version"], check=True, suppress_output=True)
-        logging.info("TeX binaries detected on PATH")
-        return True
-    except SystemExit:
+def spawn_quiet(args: list[str]) -> int:
+    # posix_spawn avoids duplicating the interpreter's page tables for tiny probes.
+    file_actions = [
+        (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+        (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+    ]
+    pid = os.posix_spawnp(args[0], args, os.environ, file_actions=file_actions)
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status)
+
+
+def check_path(strict: bool = False) -> bool:
+    if strict:
+        try:
+            returncode = spawn_quiet(["tex", "--version"])
+        except OSError as exc:
+            logging.debug("Could not run tex: %s", exc)
+            returncode = 1
+        if returncode != 0:
+            logging.debug("TeX binaries missing from PATH or not runnable (exit %d)", returncode)
+            return False
+    elif shutil.which("tex") is None:
         logging.debug("TeX binaries missing from PATH")
         return False
+    logging.info("TeX binaries detected on PATH")
+    return True
 
 
-def iter_candidate_bin_dirs() -> Iterable[Path]:
+def iter_tex_bin_dirs(bin_root: str) -> Iterable[str]:
+    try:
+        with os.scandir(bin_root) as it:
+            arch_dirs = [entry.path for entry in it if entry.is_dir()]
+    except OSError:
+        return
+    for arch_dir in arch_dirs:
+        if os.path.isfile(os.path.join(arch_dir, "tex")):
+            yield arch_dir
+
+
+def iter_candidate_bin_dirs() -> Iterable[str]:
     for root in KNOWN_TEXLIVE_ROOTS:
-        if not root.exists():
+        try:
+            with os.scandir(root) as it:
+                entries = sorted(it, key=lambda entry: entry.name, reverse=True)
+        except OSError:
             continue
-        for entry in sorted(root.iterdir(), reverse=True):
-            bin_root = entry / "bin"
-            if not bin_root.is_dir():
-                continue
-            for arch_dir in bin_root.iterdir():
-                tex_binary = arch_dir / "tex"
-                if tex_binary.is_file():
-                    yield arch_dir
-
-
-def bin_dir_from_tlmgr() -> Optional[Path]:
-    env = os.environ.copy()
-    env.setdefault("PATH", "/usr/local/bin:/usr/bin:/bin")
+        for entry in entries:
+            if entry.is_dir():
+                yield from iter_tex_bin_dirs(os.path.join(entry.path, "bin"))
+
+
+def bin_dir_from_tlmgr() -> Optional[str]:
+    # Inherit the environment as-is unless PATH needs a fallback.
+    env = None if "PATH" in os.environ else {**os.environ, "PATH": DEFAULT_PATH}
     try:
-        result = run_subprocess(["tlmgr", "conf", "texmf"], check=True, suppress_output=True, env=env)
+        result = run_subprocess(["tlmgr", "conf", "texmf"], check=True, suppress_output=True, capture_stdout=True, env=env)
     except SystemExit:
         return None
 
-    for line in (result.stdout or "").splitlines():
-        stripped = line.strip()
-        if stripped.startswith("TEXMFROOT"):
-            parts = stripped.split(None, 1)
-            if len(parts) == 2:
-                root = Path(parts[1].strip())
-                bin_root = root / "bin"
-                if bin_root.is_dir():
-                    for candidate in bin_root.iterdir():
-                        if (candidate / "tex").is_file():
-                            return candidate
+    match = TEXMFROOT_PATTERN.search(result.stdout or "")
+    if not match:
+        return None
+    return next(iter_tex_bin_dirs(os.path.join(match.group(1), "bin")), None)
+
+
+def bin_dir_from_env() -> Optional[str]:
+    explicit = os.environ.get("TEXLIVE_BIN")
+    if explicit and os.path.isfile(os.path.join(explicit, "tex")):
+        return explicit
+    texdir = os.environ.get("TEXDIR")
+    if texdir:
+        return next(iter_tex_bin_dirs(os.path.join(texdir, "bin")), None)
     return None
 
 
+@functools.lru_cache(maxsize=1)
 def resolve_texlive_bin_dir() -> Optional[Path]:
-    for candidate in iter_candidate_bin_dirs():
-        return candidate
-    return bin_dir_from_tlmgr()
+    found = bin_dir_from_env() or next(iter_candidate_bin_dirs(), None) or bin_dir_from_tlmgr()
+    return Path(found) if found else None
 
 
 def tlmgr_path_add(bin_dir: Path) -> bool:
-    env = os.environ.copy()
-    existing_path = env.get("PATH", "")
-    env["PATH"] = f"{bin_dir}:{existing_path}" if existing_path else str(bin_dir)
+    existing_path = os.environ.get("PATH", "")
+    env = {**os.environ, "PATH": f"{bin_dir}:{existing_path}" if existing_path else str(bin_dir)}
     try:
         run_subprocess(["tlmgr", "path", "add"], check=False, env=env)
     except SystemExit:
@@ -160,35 +395,55 @@ def tlmgr_path_add(bin_dir: Path) -> bool:
     return True
 
 
+def link_binary(source: str, name: str, destination: Path, dest_fd: int, replace: bool) -> bool:
+    try:
+        if replace:
+            os.unlink(name, dir_fd=dest_fd)
+        os.symlink(source, name, dir_fd=dest_fd)
+    except OSError as exc:
+        logging.error("Failed to symlink %s -> %s: %s", source, os.path.join(destination, name), exc)
+        return False
+    return True
+
+
 def symlink_binaries(bin_dir: Path, destination: Path) -> bool:
     destination.mkdir(parents=True, exist_ok=True)
-    success = True
-    for binary in bin_dir.iterdir():
-        if not binary.is_file():
-            continue
-        target = destination / binary.name
-        try:
-            if target.exists() or target.is_symlink():
-                target.unlink()
-            os.symlink(binary, target)
-        except OSError as exc:
-            logging.error("Failed to symlink %s -> %s: %s", binary, target, exc)
-            success = False
-    return success
+    with os.scandir(bin_dir) as it:
+        binaries = [(entry.path, entry.name) for entry in it if entry.is_file()]
+    # Resolve names relative to an open destination fd instead of walking the full path each time.
+    dest_fd = os.open(destination, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        with os.scandir(dest_fd) as it:
+            existing = {entry.name for entry in it}
+        with ThreadPoolExecutor(max_workers=SYMLINK_WORKERS) as executor:
+            futures = [executor.submit(link_binary, source, name, destination, dest_fd, name in existing) for source, name in binaries]
+            results = [future.result() for future in futures]
+    finally:
+        os.close(dest_fd)
+    return all(results)
 
 
-def run_install(version: str, profile: str, mirror: str, archive_mirror: str, workdir: Path) -> None:
+def run_install(version: str, profile: str, mirror: str, archive_mirror: str, workdir: Path, exec_installer: bool = False, strict_check: bool = False) -> None:
     installer = locate_install_tl(workdir)
-    mirror_url = mirror.rstrip("/") + "/"
+    mirror_url = build_repository_url("latest", mirror, archive_mirror) + "/"
     args = ["perl", str(installer), f"--profile={profile}", f"--location={mirror_url}"]
     if version != "latest":
-        repository = archive_mirror.rstrip("/") + f"/{version}/tlnet-final"
-        args.append(f"--repository={repository}")
+        args.append(f"--repository={build_repository_url(version, mirror, archive_mirror)}")
+
+    if exec_installer:
+        logging.info("Handing over to TeXLive installer; PATH fallbacks are skipped")
+        os.chdir(workdir)
+        try:
+            os.execvp(args[0], args)
+        except OSError as exc:
+            logging.error("Failed to exec %s: %s", args[0], exc)
+            raise SystemExit(1) from exc
 
     logging.info("Running TeXLive installer")
     run_subprocess(args, cwd=workdir)
+    resolve_texlive_bin_dir.cache_clear()
 
-    if check_path():
+    if check_path(strict_check):
         return
 
     logging.warning("Installer did not configure PATH; attempting tlmgr path add")
@@ -197,49 +452,53 @@ def run_install(version: str, profile: str, mirror: str, archive_mirror: str, wo
         logging.error("Could not locate TeXLive binary directory")
         raise SystemExit(1)
 
-    if tlmgr_path_add(bin_dir) and check_path():
+    if tlmgr_path_add(bin_dir) and check_path(strict_check):
         return
 
     logging.warning("tlmgr path add failed; creating manual symlinks in %s", SYMLINK_DESTINATION)
-    if symlink_binaries(bin_dir, SYMLINK_DESTINATION) and check_path():
+    if symlink_binaries(bin_dir, SYMLINK_DESTINATION) and check_path(strict_check):
         return
 
     logging.error("Failed to make TeXLive binaries available on PATH")
     raise SystemExit(1)
 
 
-def parse_args(argv: list[str]) -> argparse.Namespace:
+@functools.cache
+def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="TeXLive installer helper")
     parser.add_argument("command", choices=["get-installer", "install"], help="Operation to perform")
     parser.add_argument("version", help="TeXLive version to install; use 'latest' for current release")
     parser.add_argument(
         "--mirror",
-        default=os.environ.get("TL_MIRROR", DEFAULT_MIRROR),
         help="Primary CTAN mirror for current releases",
     )
     parser.add_argument(
         "--archive-mirror",
-        default=os.environ.get("TL_ARCHIVE_MIRROR", DEFAULT_ARCHIVE_MIRROR),
         help="Archive mirror for historic releases",
     )
     parser.add_argument(
         "--archive-name",
-        default=os.environ.get("TL_INSTALL_ARCHIVE", DEFAULT_ARCHIVE_NAME),
         help="Installer archive filename",
     )
     parser.add_argument(
         "--cache-buster",
-        default=os.environ.get("TL_CACHE_BUSTER", DEFAULT_CACHE_BUSTER),
         help="Token appended to download URLs to bypass Docker cache",
     )
+    parser.add_argument(
+        "--download-chunk-size",
+        type=positive_int,
+        help="Buffer size in bytes used when streaming the installer download",
+    )
+    parser.add_argument(
+        "--sha256",
+        help="Expected SHA256 of the downloaded installer; empty skips verification (get-installer only)",
+    )
     parser.add_argument(
         "--profile",
-        default=os.environ.get("TL_PROFILE", "texlive.profile"),
         help="TeXLive profile used during installation",
     )
     parser.add_argument(
         "--workdir",
-        default=os.environ.get("TL_WORKDIR", os.getcwd()),
         help="Working directory containing install-tl files",
     )
     parser.add_argument(
@@ -247,7 +506,34 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         default=None,
         help="Destination path for downloaded installer (get-installer only)",
     )
+    parser.add_argument(
+        "--exec",
+        dest="exec_installer",
+        action="store_true",
+        help="Replace this process with install-tl and skip PATH fallbacks (install only)",
+    )
+    parser.add_argument(
+        "--strict-check",
+        action="store_true",
+        help="Verify TeX is runnable via 'tex --version' instead of only locating it on PATH",
+    )
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
+    return parser
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = build_parser()
+    # Environment-derived defaults are refreshed per call since the parser itself is cached.
+    parser.set_defaults(
+        mirror=os.environ.get("TL_MIRROR", DEFAULT_MIRROR),
+        archive_mirror=os.environ.get("TL_ARCHIVE_MIRROR", DEFAULT_ARCHIVE_MIRROR),
+        archive_name=os.environ.get("TL_INSTALL_ARCHIVE", DEFAULT_ARCHIVE_NAME),
+        cache_buster=os.environ.get("TL_CACHE_BUSTER", DEFAULT_CACHE_BUSTER),
+        download_chunk_size=os.environ.get("TL_DOWNLOAD_CHUNK", DEFAULT_DOWNLOAD_CHUNK_SIZE),
+        sha256=os.environ.get("TL_INSTALL_SHA256", ""),
+        profile=os.environ.get("TL_PROFILE", "texlive.profile"),
+        workdir=os.environ.get("TL_WORKDIR", os.getcwd()),
+    )
     return parser.parse_args(argv)
 
 
@@ -265,11 +551,13 @@ def main(argv: list[str]) -> int:
             args.archive_mirror,
             args.cache_buster,
             output,
+            args.download_chunk_size,
+            args.sha256,
         )
         return 0
 
     if args.command == "install":
-        run_install(args.version, args.profile, args.mirror, args.archive_mirror, workdir)
+        run_install(args.version, args.profile, args.mirror, args.archive_mirror, workdir, args.exec_installer, args.strict_check)
         return 0
 
     logging.error("Unknown command: %s", args.command)